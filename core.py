@@ -1,6 +1,8 @@
+import heapq
 import itertools
+import sys
+import weakref
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from copy import copy
 from typing import (
     Any,
@@ -9,7 +11,10 @@ from typing import (
     Dict,
     Generator,
     Generic,
+    Iterable,
+    Iterator,
     List,
+    MutableMapping,
     Optional,
     Tuple,
     Type,
@@ -17,7 +22,7 @@ from typing import (
     Union,
 )
 from typing_extensions import Self
-from time import time
+from time import monotonic
 
 __all__ = (
     "NiceCollection",
@@ -89,17 +94,72 @@ class FieldExtractingMeta(type):
         for name in invalidated_attrs:
             _dict.pop(name, None)
 
-        if fields or nice_nestings:
-            slots = tuple(itertools.chain(fields.keys(), nice_nestings.keys()))
-            if "__slots__" in _dict:
-                slots += _dict["__slots__"]
-            _dict["__slots__"] = slots
+        # slots are always injected, so that subclasses without fields
+        # don't silently get a per-instance __dict__
+        slots = tuple(itertools.chain(fields.keys(), nice_nestings.keys()))
+        declared_slots = _dict.get("__slots__", ())
+        if isinstance(declared_slots, str):
+            declared_slots = (declared_slots,)
+        _dict["__slots__"] = slots + tuple(declared_slots)
+
+        # The name under which each field is stored in mongo is resolved once here,
+        # so that hot paths don't have to coalesce real_name and attribute name.
+        # It's stored per class, since field instances may be shared between classes.
+        mongo_names = {
+            name: sys.intern(field.real_name or name)
+            for name, field in itertools.chain(fields.items(), nice_nestings.items())
+        }
 
         _dict["_fields"] = fields
         _dict["_nice_nestings"] = nice_nestings
+        _dict["_mongo_names"] = mongo_names
+        _dict["_load_fields"] = _make_fields_loader(fields, nice_nestings, mongo_names)
         return super().__new__(cls, _name, _bases, _dict)
 
 
+def _make_fields_loader(
+    fields: Dict[str, "FieldBase"],
+    nice_nestings: Dict[str, Union["NestingFactory", "FieldWithNestings"]],
+    mongo_names: Dict[str, str],
+) -> Callable[[Any, Dict[str, Any]], None]:
+    # Similarly to how dataclasses generate __init__, this generates
+    # a function with straight-line code that converts raw data of each field,
+    # which is faster than looping over fields for every instance.
+    namespace: Dict[str, Any] = {}
+    lines = ["def _load_fields(self, data):"]
+
+    for i, (name, field) in enumerate(fields.items()):
+        namespace[f"_from_raw_{i}"] = _pick_from_raw(field)
+        lines.append(
+            f"    self.{name} = _from_raw_{i}(data.get({mongo_names[name]!r}))"
+        )
+
+    for i, (name, field) in enumerate(nice_nestings.items()):
+        namespace[f"_nesting_from_raw_{i}"] = field.from_raw
+        lines.append(
+            f"    self.{name} = _nesting_from_raw_{i}"
+            f"(data.get({mongo_names[name]!r}), {name!r}, self)"
+        )
+
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    exec("\n".join(lines), namespace)
+    return namespace["_load_fields"]
+
+
+def _pick_from_raw(field: "FieldBase") -> Callable[[Any], Any]:
+    # The specialized closure skips a frame, but it's only equivalent
+    # to from_raw as long as a subclass doesn't override the latter.
+    if isinstance(field, FieldWithContainer):
+        if type(field).from_raw is FieldWithContainer.from_raw:
+            return field._fast_from_raw
+    elif isinstance(field, FieldWithDict):
+        if type(field).from_raw is FieldWithDict.from_raw:
+            return field._fast_from_raw
+    return field.from_raw
+
+
 class FieldBase(ABC):
     """A base class for all field variations.
     Feilds are essentially just converters from raw json-like data to arbitrary python objects and back.
@@ -124,6 +184,10 @@ class FieldBase(ABC):
     def to_raw(self, value: Any) -> Any:
         ...
 
+    def to_raw_into(self, value: Any, out: List[Any]) -> None:
+        """Converts a collection of elements and appends the results to `out`."""
+        out.extend(self.to_raw(value))
+
 
 class Field(FieldBase):
     def __init__(
@@ -134,21 +198,26 @@ class Field(FieldBase):
         alias_for: Optional[str] = None,
     ):
         super().__init__(default, alias_for)
-        identity = lambda x: x
-        self._from_raw: Callable[[T1], T2] = from_raw or identity
-        self._to_raw: Callable[[T2], T1] = to_raw or identity
+        # converters are left as None instead of identity lambdas
+        # to avoid pointless python calls on every conversion
+        self._from_raw: Optional[Callable[[T1], T2]] = from_raw
+        self._to_raw: Optional[Callable[[T2], T1]] = to_raw
         self._cache_binding: Optional[Dict[Any, Any]] = None
 
     def from_raw(self, value):
         if value is None:
             return self.default
 
+        if self._from_raw is None:
+            return value
         return self._from_raw(value)
 
     def to_raw(self, value):
         if value == self._default:
             return None
 
+        if self._to_raw is None:
+            return value
         return self._to_raw(value)
 
 
@@ -164,20 +233,60 @@ class FieldWithContainer(FieldBase, Generic[SizedIterableT]):
         if default is Ellipsis:
             default = sized_iterable()
         super().__init__(default, alias_for)
-        id_: Callable[[Any], Any] = lambda x: x
         self._sized_iterable: Type[SizedIterableT] = sized_iterable
-        self.from_raw_element: Callable[[T1], T2] = from_raw_element or id_
-        self.to_raw_element: Callable[[T2], T1] = to_raw_element or id_
+        self.from_raw_element: Optional[Callable[[T1], T2]] = from_raw_element
+        self.to_raw_element: Optional[Callable[[T2], T1]] = to_raw_element
+        self._fast_from_raw: Callable[
+            [Optional[SizedIterableT]], SizedIterableT
+        ] = self._make_from_raw()
+
+    def _make_from_raw(self) -> Callable[[Optional[SizedIterableT]], SizedIterableT]:
+        # A specialized closure over locals, which the generated field loaders
+        # call directly. It skips attribute lookups and the converter check.
+        default = self._default
+        sized_iterable = self._sized_iterable
+        from_raw_element = self.from_raw_element
+
+        if from_raw_element is None:
+
+            def from_raw(value: Optional[SizedIterableT]) -> SizedIterableT:
+                if value is None:
+                    return copy(default)
+                return sized_iterable(value)
 
-    def from_raw(self, value: Optional[SizedIterableT]):
-        if value is None:
-            return self.default
+        else:
+
+            def from_raw(value: Optional[SizedIterableT]) -> SizedIterableT:
+                if value is None:
+                    return copy(default)
+                return sized_iterable(map(from_raw_element, value))
 
-        return self._sized_iterable(self.from_raw_element(el) for el in value)
+        return from_raw
+
+    def from_raw(self, value: Optional[SizedIterableT]):
+        return self._fast_from_raw(value)
 
     def to_raw(self, value: SizedIterableT):
+        if self.to_raw_element is None:
+            return self._sized_iterable(value)
         return self._sized_iterable(self.to_raw_element(el) for el in value)
 
+    def to_raw_into(self, value: Iterable[Any], out: List[Any]) -> None:
+        # skips building an intermediate container
+        if self.to_raw_element is None:
+            out.extend(value)
+        else:
+            out.extend(map(self.to_raw_element, value))
+
+
+def _convert_items(
+    data: Dict[Any, Any], convert_item: Callable[[Any, Any], Tuple[Any, Any]]
+) -> Dict[Any, Any]:
+    # a dict comprehension is noticeably faster than dict(generator)
+    return {
+        key: value for k, v in data.items() for key, value in (convert_item(k, v),)
+    }
+
 
 class FieldWithDict(FieldBase):
     def __init__(
@@ -190,18 +299,44 @@ class FieldWithDict(FieldBase):
         if default is Ellipsis:
             default = {}
         super().__init__(default, alias_for)
-        id_ = lambda x, y: (x, y)
-        self.from_raw_item: Callable[[T1, V1], Tuple[T2, V2]] = from_raw_item or id_
-        self.to_raw_item: Callable[[T2, V2], Tuple[T1, V1]] = to_raw_item or id_
+        self.from_raw_item: Optional[Callable[[T1, V1], Tuple[T2, V2]]] = from_raw_item
+        self.to_raw_item: Optional[Callable[[T2, V2], Tuple[T1, V1]]] = to_raw_item
+        self._fast_from_raw: Callable[[Optional[dict]], dict] = self._make_from_raw()
 
-    def from_raw(self, data: Optional[dict]) -> dict:
-        if data is None:
-            return self.default
+    def _make_from_raw(self) -> Callable[[Optional[dict]], dict]:
+        # A specialized closure over locals, which the generated field loaders
+        # call directly. It skips attribute lookups and the converter check.
+        default = self._default
+        from_raw_item = self.from_raw_item
+
+        if from_raw_item is None:
+
+            def from_raw(data: Optional[dict]) -> dict:
+                if data is None:
+                    return copy(default)
+                return data.copy()
+
+        else:
+
+            def from_raw(data: Optional[dict]) -> dict:
+                if data is None:
+                    return copy(default)
+                return _convert_items(data, from_raw_item)
 
-        return dict(self.from_raw_item(k, v) for k, v in data.items())
+        return from_raw
+
+    def from_raw(self, data: Optional[dict]) -> dict:
+        return self._fast_from_raw(data)
 
     def to_raw(self, data: dict) -> dict:
-        return dict(self.to_raw_item(k, v) for k, v in data.items())
+        if self.to_raw_item is None:
+            return data.copy()
+        return _convert_items(data, self.to_raw_item)
+
+    def to_raw_pair(self, key: Any, value: Any) -> Tuple[Any, Any]:
+        if self.to_raw_item is None:
+            return key, value
+        return self.to_raw_item(key, value)
 
 
 class FieldWithNestings(FieldBase):
@@ -217,7 +352,7 @@ class FieldWithNestings(FieldBase):
             default = {}
         super().__init__(default, alias)
         self.cls: Type[NiceNesting] = cls
-        self.from_raw_key: Callable[[Any], Any] = from_raw_key or (lambda x: x)
+        self.from_raw_key: Optional[Callable[[Any], Any]] = from_raw_key
         self.to_raw_key: Callable[[Any], Any] = to_raw_key or (lambda x: x)
 
     def from_raw(
@@ -227,14 +362,16 @@ class FieldWithNestings(FieldBase):
             return self.default
 
         res = {}
+        from_raw_key = self.from_raw_key
+        mongo_name = parent._mongo_names[attr_name]
         for k, v in data.items():
-            key = self.from_raw_key(k)
+            key = k if from_raw_key is None else from_raw_key(k)
             res[key] = self.cls(
                 attr_name="",
                 id=key,
                 data=v,
                 parent=parent,
-                alias=f"{self.real_name or attr_name}.{k}",
+                alias=f"{mongo_name}.{k}",
             )
 
         return res
@@ -296,6 +433,7 @@ class CommandMaker:
         "_to_pop",
         "_pseudo_nestings",
         "_pseudo_attrs",
+        "_children",
     )
 
     def __init__(
@@ -311,24 +449,31 @@ class CommandMaker:
         self._name: str = name
         self._value: Any = value
         self._to_inc: Any = None
-        self._to_add: List[Any] = []
-        self._to_remove: List[Any] = []
-        self._to_update: Dict[Any, Any] = {}
-        self._to_pop: List[Any] = []
-        self._pseudo_nestings: Dict[Any, CommandMaker] = {}
-        self._pseudo_attrs: Dict[str, CommandMaker] = {}
+        # containers are allocated on first use, since most nodes never need them
+        self._to_add: Optional[List[Any]] = None
+        self._to_remove: Optional[List[Any]] = None
+        self._to_update: Optional[Dict[Any, Any]] = None
+        self._to_pop: Optional[List[Any]] = None
+        self._pseudo_nestings: Optional[Dict[Any, CommandMaker]] = None
+        self._pseudo_attrs: Optional[Dict[str, CommandMaker]] = None
+        # values of both _pseudo_attrs and _pseudo_nestings in insertion order
+        self._children: Optional[List[CommandMaker]] = None
 
     def __getattr__(self, name: str) -> Any:
         # this dunder method is called AFTER __getattribute__,
         # thus it doesn't cause any issues with getting normal attributes.
-        if name in self._pseudo_attrs:
+        if self._pseudo_attrs is None:
+            self._pseudo_attrs = {}
+        elif name in self._pseudo_attrs:
             return self._pseudo_attrs[name]
-        # this also ensures that this attribute exists in the corresponding model
-        sub_underlying = getattr(self._underlying, name)
+        underlying = self._get_underlying()
+        self._ensure_field(underlying, name)
+        # the underlying value is only fetched if this turns out to be a branch
         sub_magic = self.__class__(
-            name, underlying=sub_underlying, underlying_owner=self._underlying
+            name, underlying=MISSING, underlying_owner=underlying
         )
         self._pseudo_attrs[name] = sub_magic
+        self._add_child(sub_magic)
         return sub_magic
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -341,15 +486,20 @@ class CommandMaker:
             # ideally this happens only after __iadd__
             return
 
-        sub_magic = self._pseudo_attrs.get(name)
-        if sub_magic is not None:
-            sub_magic._value = value
-            return None
-        # this also ensures that this attribute exists in the corresponding model
-        sub_underlying = getattr(self._underlying, name)
-        self._pseudo_attrs[name] = self.__class__(
-            name, value, underlying=sub_underlying, underlying_owner=self._underlying
+        if self._pseudo_attrs is None:
+            self._pseudo_attrs = {}
+        else:
+            sub_magic = self._pseudo_attrs.get(name)
+            if sub_magic is not None:
+                sub_magic._value = value
+                return None
+        underlying = self._get_underlying()
+        self._ensure_field(underlying, name)
+        sub_magic = self.__class__(
+            name, value, underlying=MISSING, underlying_owner=underlying
         )
+        self._pseudo_attrs[name] = sub_magic
+        self._add_child(sub_magic)
 
     def __getitem__(self, key: Any) -> Any:
         # Once we're here, it means that this instance fakes a dict attribute.
@@ -362,10 +512,13 @@ class CommandMaker:
         if not isinstance(_field, FieldWithNestings):
             raise SyntaxError("You're not supposed to get items of this attribute")
 
-        if key in self._pseudo_nestings:
+        if self._pseudo_nestings is None:
+            self._pseudo_nestings = {}
+        elif key in self._pseudo_nestings:
             return self._pseudo_nestings[key]
 
-        sub_underlying = self._underlying.get(key)
+        underlying = self._get_underlying()
+        sub_underlying = underlying.get(key)
         # at this point we know that this attribute is generated by _field
         if sub_underlying is None:
             sub_underlying = _field.cls(
@@ -373,13 +526,15 @@ class CommandMaker:
                 id=key,
                 data=None,
                 parent=self._underlying_owner,
-                alias=f"{_field.real_name or self._name}.{_field.to_raw_key(key)}",
+                alias=f"{self._underlying_owner._mongo_names[self._name]}."
+                f"{_field.to_raw_key(key)}",
             )
 
         sub_magic = self.__class__(
-            str(key), underlying=sub_underlying, underlying_owner=self._underlying
+            str(key), underlying=sub_underlying, underlying_owner=underlying
         )
         self._pseudo_nestings[key] = sub_magic
+        self._add_child(sub_magic)
         return sub_magic
 
     def __setitem__(self, key: Any, value: Any) -> None:
@@ -390,6 +545,8 @@ class CommandMaker:
                 "You're not supposed to directly assign nestings to dict keys. "
                 "Modify the attributes of nestings directly: cmd.things[key].attr = value"
             )
+        if self._to_update is None:
+            self._to_update = {}
         self._to_update[key] = value
 
     def __iadd__(self, value: Any) -> Any:
@@ -406,59 +563,61 @@ class CommandMaker:
         mongo_command = {}
         setters = {}
         unsetters = {}
-        adders = defaultdict(list)
-        removers = defaultdict(list)
+        adders: Dict[str, List[Any]] = {}
+        removers: Dict[str, List[Any]] = {}
         doc = self._underlying.document
+        doc_id = doc.id
 
-        for magic in self._iter_leaves():
+        for magic in self._walk():
             to_set = magic._value
             to_add = magic._to_add
             to_remove = magic._to_remove
             to_update = magic._to_update
             to_pop = magic._to_pop
             to_inc = magic._to_inc
+            name = magic._name
 
             underlying_owner = magic._underlying_owner
             if not isinstance(underlying_owner, NiceNesting):
                 raise ValueError("Updating irrelevant attributes is not allowed")
             # this also ensures that the user updated an existing field
-            field = underlying_owner._fields.get(magic._name)
+            field = underlying_owner._fields.get(name)
             if field is None:
-                field = underlying_owner._nice_nestings[magic._name]
+                field = underlying_owner._nice_nestings[name]
 
-            route = underlying_owner.route_prefix + (field.real_name or magic._name)
+            route = underlying_owner.route_prefix + underlying_owner._mongo_names[name]
 
             if to_set is Ellipsis:
                 unsetters[route] = ""
-                setattr(underlying_owner, magic._name, field.default)
-                self._binding_pop(field, doc.id)
+                setattr(underlying_owner, name, field.default)
+                self._binding_pop(field, doc_id)
 
             elif to_set is not MISSING:
                 setters[route] = field.to_raw(to_set)
-                setattr(underlying_owner, magic._name, to_set)
-                self._binding_update(field, doc.id, to_set)
+                setattr(underlying_owner, name, to_set)
+                self._binding_update(field, doc_id, to_set)
 
             if to_inc is not None:
                 # we're not going to use "$inc" because we should still support conversion
                 # (e.g. string to int and back)
-                new_value = getattr(underlying_owner, magic._name) + to_inc
+                new_value = getattr(underlying_owner, name) + to_inc
                 setters[route] = field.to_raw(new_value)
-                setattr(underlying_owner, magic._name, new_value)
-                self._binding_update(field, doc.id, new_value)
+                setattr(underlying_owner, name, new_value)
+                self._binding_update(field, doc_id, new_value)
 
             containter = None
 
             if to_add:
-                adders[route].extend(field.to_raw(to_add))
-                containter = getattr(underlying_owner, magic._name)
+                field.to_raw_into(to_add, adders.setdefault(route, []))
+                containter = getattr(underlying_owner, name)
                 if isinstance(containter, list):
                     containter.extend(to_add)
                 elif isinstance(containter, set):
                     containter.update(to_add)
 
             if to_remove:
-                containter = containter or getattr(underlying_owner, magic._name)
-                removers[route].extend(field.to_raw(to_remove))
+                containter = containter or getattr(underlying_owner, name)
+                field.to_raw_into(to_remove, removers.setdefault(route, []))
                 for el in to_remove:
                     containter.remove(el)
 
@@ -469,17 +628,17 @@ class CommandMaker:
                     raise SyntaxError(
                         "Updating items of a field without items is not allowed"
                     )
-                dict_attr = getattr(underlying_owner, magic._name)
+                dict_attr = getattr(underlying_owner, name)
                 for key, val in to_update.items():
                     dict_attr[key] = val
-                    raw_key, raw_value = field.to_raw_item(key, val)
+                    raw_key, raw_value = field.to_raw_pair(key, val)
                     setters[f"{route}.{raw_key}"] = raw_value
 
             if to_pop:
-                dict_attr = dict_attr or getattr(underlying_owner, magic._name)
+                dict_attr = dict_attr or getattr(underlying_owner, name)
 
                 if isinstance(field, FieldWithDict):
-                    to_raw_key = lambda x: field.to_raw_item(x, dict_attr.get(x))[0]  # type: ignore
+                    to_raw_key = lambda x: field.to_raw_pair(x, dict_attr.get(x))[0]  # type: ignore
                 elif isinstance(field, FieldWithNestings):
                     to_raw_key = field.to_raw_key
                 else:
@@ -492,7 +651,6 @@ class CommandMaker:
                     dict_attr.pop(key, None)
                     unsetters[f"{route}.{raw_key}"] = ""
 
-        self._inject_nesting_branches()
         upsert = False
 
         if setters:
@@ -530,50 +688,79 @@ class CommandMaker:
             return
         field._cache_binding[doc_id] = value
 
-    def _iter_leaves(self) -> Generator["CommandMaker", None, None]:
-        for magic in itertools.chain(
-            self._pseudo_attrs.values(), self._pseudo_nestings.values()
+    def _add_child(self, magic: "CommandMaker") -> None:
+        if self._children is None:
+            self._children = []
+        self._children.append(magic)
+
+    def _get_underlying(self) -> Any:
+        underlying = self._underlying
+        if underlying is MISSING:
+            underlying = getattr(self._underlying_owner, self._name)
+            self._underlying = underlying
+        return underlying
+
+    @staticmethod
+    def _ensure_field(owner: Any, name: str) -> None:
+        # a dict lookup is enough to ensure that the field exists in the model
+        if not isinstance(owner, NiceNesting) or (
+            name not in owner._fields and name not in owner._nice_nestings
         ):
-            if magic._pseudo_attrs:
-                yield from magic._iter_leaves()
-            elif magic._pseudo_nestings:
-                yield from magic._iter_leaves()
-            else:
-                yield magic
+            raise AttributeError(
+                f"'{owner.__class__.__name__}' object has no attribute '{name}'"
+            )
 
-    def _inject_nesting_branches(self) -> None:
-        # this is done to bind newly created nestings to their corresponding cached parents
-        for key, fake_nesting in self._pseudo_nestings.items():
-            if key not in self._underlying:
-                self._underlying[key] = fake_nesting._underlying
+    def _walk(self) -> Generator["CommandMaker", None, None]:
+        # Yields leaves of the tree. Along the way, newly created nestings
+        # are bound to their corresponding cached parents.
+        if self._pseudo_nestings:
+            for key, fake_nesting in self._pseudo_nestings.items():
+                if key not in self._underlying:
+                    self._underlying[key] = fake_nesting._underlying
 
-        for magic in itertools.chain(
-            self._pseudo_attrs.values(), self._pseudo_nestings.values()
-        ):
-            magic._inject_nesting_branches()
+        if not self._children:
+            return
+
+        for magic in self._children:
+            if magic._children:
+                yield from magic._walk()
+            else:
+                yield magic
 
     def append(self, obj: Any) -> None:
         """This will append the object right before sending the mongo command"""
+        if self._to_add is None:
+            self._to_add = []
         self._to_add.append(obj)
 
     def extend(self, obj: Any) -> None:
         """This will extend the list right before sending the mongo command"""
+        if self._to_add is None:
+            self._to_add = []
         self._to_add.extend(obj)
 
     def add(self, obj: Any) -> None:
         """This will add the object right before sending the mongo command"""
+        if self._to_add is None:
+            self._to_add = []
         self._to_add.append(obj)
 
     def update(self, obj: Any) -> None:
         """This will extend the set right before sending the mongo command"""
+        if self._to_add is None:
+            self._to_add = []
         self._to_add.extend(obj)
 
     def remove(self, obj: Any) -> None:
         """This will remove the object right before sending the mongo command"""
+        if self._to_remove is None:
+            self._to_remove = []
         self._to_remove.append(obj)
 
     def pop(self, key: Any, *_) -> None:
         """This will remove the item right before sending the mongo command"""
+        if self._to_pop is None:
+            self._to_pop = []
         self._to_pop.append(key)
 
 
@@ -582,8 +769,18 @@ class NiceNesting(Generic[NiceDocumentT], metaclass=FieldExtractingMeta):
 
     _fields: Dict[str, FieldBase]
     _nice_nestings: Dict[str, Union[NestingFactory, FieldWithNestings]]
+    _mongo_names: Dict[str, str]
+    _load_fields: Callable[[Any, Dict[str, Any]], None]
 
-    __slots__ = ("id", "_parent", "_name", "_alias", "_cs_route_prefix", "_cs_document")
+    __slots__ = (
+        "id",
+        "_parent",
+        "_name",
+        "_alias",
+        "_route_prefix",
+        "_document",
+        "__weakref__",
+    )
     # slots for fields are populated automatically
 
     def __init__(
@@ -599,19 +796,13 @@ class NiceNesting(Generic[NiceDocumentT], metaclass=FieldExtractingMeta):
         self._parent: Optional[NiceNesting] = parent
         self._name: str = attr_name
         self._alias: Optional[str] = alias
-        self._cs_route_prefix: Optional[str] = None
-        self._cs_document: Optional[NiceDocumentT] = None
+        # this must happen before any sub-nestings are created
+        self._bind_route(parent)
 
         if data is None:
             data = {}
 
-        for name, field in self._fields.items():
-            use_name = field.real_name or name
-            setattr(self, name, field.from_raw(data.get(use_name)))
-
-        for name, field in self._nice_nestings.items():
-            use_name = field.real_name or name
-            setattr(self, name, field.from_raw(data.get(use_name), name, self))
+        self._load_fields(data)
 
     async def __aenter__(self) -> Self:
         # this exists to bypass linters since
@@ -623,44 +814,42 @@ class NiceNesting(Generic[NiceDocumentT], metaclass=FieldExtractingMeta):
         # .command_maker() return type is annotated as Self
         raise NotImplementedError
 
+    def _bind_route(self, parent: Optional["NiceNesting"]) -> None:
+        # Route prefix and document are derived from the parent eagerly.
+        # Nestings without a usable parent are left unbound.
+        if parent is None or parent._route_prefix is None:
+            self._route_prefix: Optional[str] = None
+            self._document: Optional[NiceDocumentT] = None
+            return
+        route_prefix = f"{parent._route_prefix}{self.mongo_name}."
+        if self._name:
+            # Named nestings have prefixes that repeat across all cached documents,
+            # so they're interned. Items of dicts with nestings have no name and
+            # their prefixes contain data keys, interning those would share nothing.
+            route_prefix = sys.intern(route_prefix)
+        self._route_prefix = route_prefix
+        # documents don't reference themselves, so that they can be freed by refcounting
+        self._document = parent if isinstance(parent, NiceDocument) else parent._document
+
     @property
     def mongo_name(self) -> str:
         return self._alias or self._name
 
     @property
     def route_prefix(self) -> str:
-        if self._cs_route_prefix is not None:
-            return self._cs_route_prefix
-        if isinstance(self._parent, NiceDocument):
-            res = f"{self.mongo_name}."
-        elif isinstance(self._parent, NiceNesting):
-            res = f"{self._parent.route_prefix}{self.mongo_name}."
-        else:
+        if self._route_prefix is None:
             raise ValueError(
-                f"Invalid parent type of '{self._name}': {self.__class__.__name__}"
+                "This nesting is not usable yet. Add it to a dict of nestings first."
             )
-        self._cs_route_prefix = res
-        return res
+        return self._route_prefix
 
     @property
     def document(self) -> NiceDocumentT:
-        if self._parent is None:
+        if self._document is None:
             raise ValueError(
                 "This nesting is not usable yet. Add it to a dict of nestings first."
             )
-        if self._cs_document is not None:
-            return self._cs_document
-
-        if isinstance(self._parent, NiceDocument):
-            res: NiceDocumentT = self._parent  # type: ignore
-        elif isinstance(self._parent, NiceNesting):
-            res = self._parent.document
-        else:
-            raise ValueError(
-                f"Invalid parent type of '{self._name}': {self.__class__.__name__}"
-            )
-        self._cs_document = res
-        return res
+        return self._document
 
     @property
     def mongo_col(self) -> AsyncCollection:
@@ -684,11 +873,12 @@ class NiceDocument(NiceNesting):
     def __init__(self, data: Dict[str, Any], collection: "NiceCollection"):
         super().__init__(attr_name="", id=data["_id"], data=data, parent=None)
         self.collection: NiceCollection = collection
-        self._last_used_at: float = time()
+        # monotonic, since it's only compared against cache lifetime
+        self._last_used_at: float = monotonic()
 
-    @property
-    def route_prefix(self) -> str:
-        return ""
+    def _bind_route(self, parent: Optional[NiceNesting]) -> None:
+        self._route_prefix = ""
+        self._document = None
 
     @property
     def document(self) -> Self:
@@ -709,14 +899,12 @@ class NiceDocument(NiceNesting):
         self = cls.__new__(cls)
         self.id = id
         self.collection = collection
+        self._bind_route(None)
 
-        for name, field in self._fields.items():
-            setattr(self, name, field.default)
-
-        for name, field in self._nice_nestings.items():
-            setattr(self, name, field.from_raw(None, name, self))
+        # every field converts missing raw data to its default
+        self._load_fields({})
 
-        self._last_used_at = time()
+        self._last_used_at = monotonic()
         return self
 
     @classmethod
@@ -724,6 +912,7 @@ class NiceDocument(NiceNesting):
         cls: Type[NiceDocumentT],
         collection: AsyncCollection,
         cache_lifetime: Optional[float] = None,
+        weak_cache: bool = False,
     ) -> "NiceCollection[NiceDocumentT]":
         """Make a `NiceCollection` instance that works with this type of documents.
 
@@ -735,8 +924,12 @@ class NiceDocument(NiceNesting):
             For how many seconds a document should be cached.
             If this parameter is `None`, all documents stay cached forever.
             If 0, nothing gets cached. Defaults to `None`.
+        weak_cache: `bool`
+            Whether documents should stay cached only while they're
+            referenced elsewhere. If `True`, `cache_lifetime` is ignored.
+            Defaults to `False`.
         """
-        return NiceCollection(collection, cls, cache_lifetime)
+        return NiceCollection(collection, cls, cache_lifetime, weak_cache)
 
     def _collect_cache_bindings(self) -> List[Dict[Any, Any]]:
         res = []
@@ -766,6 +959,11 @@ class NiceCollection(Generic[NiceDocumentT]):
         If this parameter is `None`, all documents stay cached forever.
         If this parameter is `0`, documents don't get cached.
         Defaults to `None`.
+    weak_cache: `bool`
+        Whether documents should stay cached only while they're referenced elsewhere.
+        Such documents are freed by the garbage collector, so there's no need
+        for cache lifetime. If `True`, `cache_lifetime` is ignored.
+        Defaults to `False`.
     """
 
     def __init__(
@@ -773,30 +971,59 @@ class NiceCollection(Generic[NiceDocumentT]):
         collection: AsyncCollection,
         document_wrapper: Type[NiceDocumentT],
         cache_lifetime: Optional[float] = None,
+        weak_cache: bool = False,
     ):
         self.mongo_col: AsyncCollection = collection
-        self.cache: Dict[Union[int, str], NiceDocumentT] = {}
+        self.cache: MutableMapping[Union[int, str], NiceDocumentT]
+        if weak_cache:
+            self.cache = weakref.WeakValueDictionary()
+            # documents are evicted by the garbage collector, nothing expires
+            cache_lifetime = None
+        else:
+            self.cache = {}
         self.document_wrapper: Type[NiceDocumentT] = document_wrapper
         self.cache_lifetime: Optional[float] = cache_lifetime
-        self._last_cache_check: float = time()
+        self.weak_cache: bool = weak_cache
+        # a lazy TTL heap of (expires_at, tie_breaker, document_ref) entries.
+        # Entries are not updated when documents are used, instead they're
+        # re-checked and re-pushed once they reach the top of the heap.
+        # Documents are referenced weakly, so that deleted or replaced documents
+        # aren't kept alive until their entries expire.
+        self._expiry_heap: List[Tuple[float, int, "weakref.ref[NiceDocumentT]"]] = []
+        self._expiry_counter: Iterator[int] = itertools.count()
+
+    def _push_expiry(self, doc: NiceDocumentT, expires_at: float) -> None:
+        heapq.heappush(
+            self._expiry_heap,
+            (expires_at, next(self._expiry_counter), weakref.ref(doc)),
+        )
 
-    def _verify_cache_integrity(self) -> None:
+    def _cache_document(self, doc: NiceDocumentT) -> None:
+        self.cache[doc.id] = doc
+        if self.cache_lifetime:
+            self._push_expiry(doc, doc._last_used_at + self.cache_lifetime)
+
+    def _verify_cache_integrity(self, now: float) -> None:
         if not self.cache_lifetime:
             # cache_lifetime=None means "never clear cache"
             # cache_lifetime=0 means "nothing is cached"
             return
 
-        now = time()
-        if now - self._last_cache_check < 60:
-            return
-        bad_keys = [
-            key
-            for key, doc in self.cache.items()
-            if now - doc._last_used_at > self.cache_lifetime
-        ]
-        for key in bad_keys:
-            self.cache.pop(key, None)
-        self._last_cache_check = now
+        heap = self._expiry_heap
+        # only expired entries are visited, fresh documents are never touched
+        while heap and heap[0][0] < now:
+            _, _, doc_ref = heapq.heappop(heap)
+            doc = doc_ref()
+            if doc is None or self.cache.get(doc.id) is not doc:
+                # the document was deleted or replaced since
+                continue
+            # computed exactly like the heap key, so that both comparisons agree
+            expires_at = doc._last_used_at + self.cache_lifetime
+            if expires_at < now:
+                del self.cache[doc.id]
+            else:
+                # the document was used since this entry was pushed
+                self._push_expiry(doc, expires_at)
 
     def create_cache_bindings(self, **mappings: Dict[Any, Any]) -> None:
         """Binds dicts of form `{doc_id: field_value, ...}` to regular fields
@@ -829,8 +1056,9 @@ class NiceCollection(Generic[NiceDocumentT]):
         """
         doc = self.cache.get(id)
         if doc is not None:
-            doc._last_used_at = time()
-            self._verify_cache_integrity()
+            now = monotonic()
+            doc._last_used_at = now
+            self._verify_cache_integrity(now)
             return doc
 
         return self.document_wrapper.minimal(id, self)
@@ -841,12 +1069,13 @@ class NiceCollection(Generic[NiceDocumentT]):
         """
         doc = self.cache.get(id)
 
+        now = monotonic()
         if doc is not None:
-            doc._last_used_at = time()
-            self._verify_cache_integrity()
+            doc._last_used_at = now
+            self._verify_cache_integrity(now)
             return doc
 
-        self._verify_cache_integrity()
+        self._verify_cache_integrity(now)
 
         data = await self.mongo_col.find_one({"_id": id})
 
@@ -855,16 +1084,55 @@ class NiceCollection(Generic[NiceDocumentT]):
 
         doc = self.document_wrapper(data, self)
         if self.cache_lifetime is None or self.cache_lifetime > 0:
-            self.cache[doc.id] = doc
+            self._cache_document(doc)
 
         return doc
 
+    async def find_many(
+        self, ids: Iterable[Union[int, str]]
+    ) -> Dict[Union[int, str], NiceDocumentT]:
+        """Same as `find`, but for multiple IDs at once.
+        All documents missing from cache are fetched with a single database request.
+        Returns a dict of form `{id: document, ...}`.
+        """
+        now = monotonic()
+        self._verify_cache_integrity(now)
+
+        res: Dict[Union[int, str], NiceDocumentT] = {}
+        missing = []
+
+        for id in ids:
+            doc = self.cache.get(id)
+            if doc is not None:
+                doc._last_used_at = now
+                res[id] = doc
+            else:
+                missing.append(id)
+
+        if not missing:
+            return res
+
+        found = {}
+        async for data in self.mongo_col.find({"_id": {"$in": missing}}):
+            found[data["_id"]] = data
+
+        use_cache = self.cache_lifetime is None or self.cache_lifetime > 0
+        for id in missing:
+            if id in res:
+                continue
+            doc = self.document_wrapper(found.get(id) or {"_id": id}, self)
+            if use_cache:
+                self._cache_document(doc)
+            res[id] = doc
+
+        return res
+
     async def cache_all(self) -> None:
         """Fetches all documents and caches them. This may take a while."""
         results = self.mongo_col.find({})
         async for res in results:
             doc = self.document_wrapper(res, self)
-            self.cache[doc.id] = doc
+            self._cache_document(doc)
 
     async def delete(self, id: Union[int, str]) -> None:
         """Deletes the document with the given ID from both database and cache."""